@@ -1,5 +1,11 @@
+import os
 import random
 import statistics
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from functools import lru_cache
 
 
 class AsynchronousNetwork:
@@ -8,31 +14,51 @@ class AsynchronousNetwork:
     variable delay. Broadcast updates the current position
     of the party to all members. Tick acts as the
     global clock and decides the delivery of messages.
+    Delays are bounded by d_delay, so pending messages live on a
+    timing wheel of d_delay + 1 slots and a tick only drains the
+    slot for the current time. Delays are drawn from `rng`, which
+    defaults to the global random module.
     """
-    def __init__(self, d_delay):
+    __slots__ = ('d_delay', '_randint', 'buckets', 'cursor', 'pending', 'current_time')
+
+    def __init__(self, d_delay, rng=None):
         self.d_delay = d_delay
-        self.queue = []
+        self._randint = (rng or random).randint
+        self.buckets = [[] for _ in range(d_delay + 1)]
+        self.cursor = 0
+        self.pending = 0
         self.current_time = 0
 
     def send_broadcast(self, sender_id, new_index):
-        delivery_time = self.current_time + random.randint(0, self.d_delay)
-        self.queue.append((delivery_time, sender_id, new_index))
+        # A zero delay is still delivered on the next tick, never the current one
+        offset = max(self._randint(0, self.d_delay), 1)
+        buckets = self.buckets
+        buckets[(self.cursor + offset) % len(buckets)].append((sender_id, new_index))
+        self.pending += 1
 
     def tick(self, parties):
+        """
+        Advances the clock and delivers every due message. `parties` is a
+        dict of party_id -> RingParty, or any receiver with
+        update_view(sender_id, index) such as the RingState run_scenario
+        passes.
+        """
         self.current_time += 1
-        delivered = []
-        remaining = []
-        for msg in self.queue:
-            if msg[0] <= self.current_time:
-                delivered.append(msg)
-            else:
-                remaining.append(msg)
-        self.queue = remaining
-        for _, sender_id, idx in delivered:
-            for p_id, party in parties.items():
-                if p_id != sender_id:
-                    party.update_view(sender_id, idx)
-        return len(delivered) > 0
+        self.cursor = (self.cursor + 1) % len(self.buckets)
+        # Idle network: nothing can be due, skip the bucket lookup
+        if not self.pending:
+            return False
+        bucket = self.buckets[self.cursor]
+        if not bucket:
+            return False
+        if isinstance(parties, Mapping):
+            parties = _PartyFanout(parties)
+        update_view = parties.update_view
+        for sender_id, idx in bucket:
+            update_view(sender_id, idx)
+        self.pending -= len(bucket)
+        bucket.clear()
+        return True
 
 
 class RingParty:
@@ -53,11 +79,202 @@ class RingParty:
         self.view_of_others[sender_id] = index
 
 
-def run_scenario(n, m, d, x):
+class _PartyFanout:
+    """Delivers a broadcast to every RingParty in a dict except the sender."""
+    __slots__ = ('parties',)
+
+    def __init__(self, parties):
+        self.parties = parties
+
+    def update_view(self, sender_id, index):
+        for p_id, party in self.parties.items():
+            if p_id != sender_id:
+                party.update_view(sender_id, index)
+
+
+@dataclass
+class RingState:
+    """
+    Structure-of-arrays form of every RingParty in a ring. Each list is
+    indexed by party id (slot 0 is unused). front[p] is the neighbour
+    party p must keep its gap to and behind[p] is the party whose front
+    neighbour is p. Only the front neighbour's position is ever read, so
+    view_front[p] holds party p's last known position of front[p] and a
+    delivered broadcast is a single write. run_scenario works on this
+    instead of a dict of RingParty objects to keep the hot loop on plain
+    list indexing.
+    """
+    # Declared by hand rather than @dataclass(slots=True), which needs Python 3.10
+    __slots__ = ('my_index', 'view_front', 'pads_used', 'front', 'behind')
+
+    my_index: list
+    view_front: list
+    pads_used: list
+    front: list
+    behind: list
+
+    @classmethod
+    def create(cls, n, m):
+        start = [0] + [i * (n // m) for i in range(m)]
+        front = [0] + [(pid % m) + 1 for pid in range(1, m + 1)]
+        behind = [0] + [((pid - 2) % m) + 1 for pid in range(1, m + 1)]
+        return cls(
+            my_index=list(start),
+            view_front=[start[f] for f in front],
+            pads_used=[0] * (m + 1),
+            front=front,
+            behind=behind,
+        )
+
+    def clone(self):
+        """Returns a copy with its own mutable lists; the topology tables are shared."""
+        return RingState(
+            my_index=list(self.my_index),
+            view_front=list(self.view_front),
+            pads_used=list(self.pads_used),
+            front=self.front,
+            behind=self.behind,
+        )
+
+    def update_view(self, sender_id, index):
+        receiver_id = self.behind[sender_id]
+        # With a single party the only reader would be the sender itself
+        if receiver_id != sender_id:
+            self.view_front[receiver_id] = index
+
+
+def get_move_status(state, burned, p_id, n, d):
+    """
+    Returns:
+    'data' if next pad is fresh and gap is safe.
+    'drift' if next pad is burned but gap is safe.
+    None if gap is unsafe (blocked by neighbor).
+    """
+    pos = state.my_index[p_id]
+    neighbor_pos = state.view_front[p_id]
+
+    # Both positions are in [0, n), so a conditional add or reset replaces each modulo
+    gap = neighbor_pos - pos
+    if gap < 0:
+        gap += n
+    next_idx = pos + 1
+    if next_idx == n:
+        next_idx = 0
+
+    if gap > d:
+        if not burned[next_idx]:
+            return 'data', next_idx
+        else:
+            return 'drift', next_idx
+    return None, None
+
+
+def make_scenario_runner(n, m, d):
+    """
+    Returns run(x, rng=None), the simulation loop of run_scenario for a
+    fixed (n, m, d). The starting ring and the utilization bound are built
+    once here instead of on every trial.
+    """
+    MAX_UTILIZATION = n - (m * d)
+    ids = range(1, m + 1)
+    initial_state = RingState.create(n, m)
+
+    def run(x, rng=None):
+        # Slicing would silently accept any x, unlike the random.sample it replaced
+        if not 0 <= x <= m:
+            raise ValueError(f"x must be between 0 and m={m}, got {x}")
+        rng = rng or random
+        network = AsynchronousNetwork(d, rng)
+        # One shuffle picks the active senders; the remainder are silent
+        all_ids = list(ids)
+        rng.shuffle(all_ids)
+        active_ids, silent_ids = all_ids[:x], all_ids[x:]
+        state = initial_state.clone()
+        my_index, pads_used = state.my_index, state.pads_used
+
+        # Initially, we only burn the starting positions of the ACTIVE IDs to track progress
+        burned = bytearray(n)
+        burned_count = 0
+        for pid in active_ids:
+            if not burned[my_index[pid]]:
+                burned[my_index[pid]] = 1
+                burned_count += 1
+
+        # Bind the per-tick callables to locals so the loop avoids global/attribute lookups
+        tick, send_broadcast = network.tick, network.send_broadcast
+        move_status, randrange = get_move_status, rng.randrange
+        # Reused every tick: the legal candidates and their moves, first k slots valid
+        cand_ids, cand_moves = [0] * m, [None] * m
+
+        # Move statuses only change when some party moved or a broadcast arrived
+        dirty = True
+        while burned_count < MAX_UTILIZATION:
+            if tick(state):
+                dirty = True
+            elif not dirty:
+                # Everyone was blocked last tick and no view changed since
+                continue
+
+            moved_in_tick = False
+
+            # 1. Priority: Active senders
+            # They either encrypt (burn) or drift (skip burned pads)
+            # Each candidate is evaluated once; the chosen move is read back from the buffer
+            k = 0
+            for pid in active_ids:
+                move = move_status(state, burned, pid, n, d)
+                if move[0] is not None:
+                    cand_ids[k], cand_moves[k] = pid, move
+                    k += 1
+            if k:
+                chosen = randrange(k)
+                sid = cand_ids[chosen]
+                status, nxt = cand_moves[chosen]
+
+                my_index[sid] = nxt
+                if status == 'data':
+                    if burned[nxt]:
+                        # This is a 'Loud Fail' - it proves a security breach occurred
+                        raise RuntimeError(f"CRITICAL SECURITY FAILURE: Pad index {nxt} reused!")
+                    burned[nxt] = 1
+                    burned_count += 1
+                    pads_used[sid] += 1
+
+                # Broadcast the new position regardless of whether it was data or drift
+                send_broadcast(sid, nxt)
+                moved_in_tick = True
+
+            # 2. Priority: Silent parties (Always jump/drift, never burn)
+            else:
+                k = 0
+                for pid in silent_ids:
+                    move = move_status(state, burned, pid, n, d)
+                    if move[0] is not None:
+                        cand_ids[k], cand_moves[k] = pid, move
+                        k += 1
+                if k:
+                    chosen = randrange(k)
+                    jid = cand_ids[chosen]
+                    status, nxt = cand_moves[chosen]
+                    my_index[jid] = nxt
+                    send_broadcast(jid, nxt)
+                    moved_in_tick = True
+
+            # Termination: Break if no one can move and no broadcasts are pending
+            if not moved_in_tick and not network.pending:
+                break
+            dirty = moved_in_tick
+
+        return n - burned_count
+
+    return run
+
+
+def run_scenario(n, m, d, x, rng=None):
     """
     Simulation loop for a specific ring configuration.
     1. Initializes party positions and categorizes as 'Active' and 'Silent' parties.
-    2. Uses a burned set to track used OTPs
+    2. Uses a burned bitmap (one byte per pad) to track used OTPs
     3. Moves are categorized into three types:
         - 'Data': Active senders consume fresh pads if the gap is safe
         - 'Drift': Senders skip used pads to find fresh ones
@@ -65,90 +282,51 @@ def run_scenario(n, m, d, x):
     4. Terminates when a 'Clinch' state is reached, i.e., no one can move and no broadcasts
     are pending.
 
+    Random choices come from `rng` (a random.Random), or the global random
+    module when it is not given.
+
     Returns the count of unused pads.
     """
-    network = AsynchronousNetwork(d)
-    all_ids = list(range(1, m + 1))
-    active_ids = random.sample(all_ids, x)
-    silent_ids = [i for i in all_ids if i not in active_ids]
-    parties = {i: RingParty(i, n, m, d) for i in range(1, m + 1)}
-
-    # Initially, we only burn the starting positions of the ACTIVE IDs to track progress
-    burned = set(parties[pid].my_index for pid in active_ids)
-    MAX_UTILIZATION = n - (m * d)
+    return make_scenario_runner(n, m, d)(x, rng)
 
-    while len(burned) < MAX_UTILIZATION:
-        network.tick(parties)
-
-        def get_move_status(p_id):
-            """
-            Returns:
-            'data' if next pad is fresh and gap is safe.
-            'drift' if next pad is burned but gap is safe.
-            None if gap is unsafe (blocked by neighbor).
-            """
-            p = parties[p_id]
-            front_id = (p.party_id % m) + 1
-            neighbor_pos = p.view_of_others[front_id]
-
-            gap = (neighbor_pos - p.my_index) % n
-            next_idx = (p.my_index + 1) % n
-
-            if gap > d:
-                if next_idx not in burned:
-                    return 'data', next_idx
-                else:
-                    return 'drift', next_idx
-            return None, None
-
-        moved_in_tick = False
-
-        # 1. Priority: Active senders
-        # They either encrypt (burn) or drift (skip burned pads)
-        legal_senders = [pid for pid in active_ids if get_move_status(pid)[0] is not None]
-        if legal_senders:
-            sid = random.choice(legal_senders)
-            status, nxt = get_move_status(sid)
-
-            parties[sid].my_index = nxt
-            if status == 'data':
-                if nxt in burned:
-                    # This is a 'Loud Fail' - it proves a security breach occurred
-                    raise RuntimeError(f"CRITICAL SECURITY FAILURE: Pad index {nxt} reused!")
-                burned.add(nxt)
-                parties[sid].pads_used += 1
-
-            # Broadcast the new position regardless of whether it was data or drift
-            network.send_broadcast(sid, nxt)
-            moved_in_tick = True
-
-        # 2. Priority: Silent parties (Always jump/drift, never burn)
-        else:
-            legal_jumpers = [pid for pid in silent_ids if get_move_status(pid)[0] is not None]
-            if legal_jumpers:
-                jid = random.choice(legal_jumpers)
-                status, nxt = get_move_status(jid)
-                parties[jid].my_index = nxt
-                network.send_broadcast(jid, nxt)
-                moved_in_tick = True
 
-        # Termination: Break if no one can move and no broadcasts are pending
-        if not moved_in_tick and not network.queue:
-            break
+@lru_cache(maxsize=16)
+def _cached_runner(n, m, d):
+    """One runner per configuration and process, reused by every trial there."""
+    return make_scenario_runner(n, m, d)
 
-    return n - len(burned)
+
+def _trial(args):
+    """Runs one seeded scenario. Module-level so a process pool can pickle it."""
+    n, m, d, x, seed = args
+    return _cached_runner(n, m, d)(x, random.Random(seed))
+
+
+def run_trials(n, m, d, x, trials, pool=None):
+    """
+    Runs `trials` independent scenarios seeded 0..trials-1 and returns the
+    unused pad count of each. When a process pool is given the trials are
+    spread across its workers; the results are identical either way.
+    """
+    jobs = [(n, m, d, x, seed) for seed in range(trials)]
+    if pool is None:
+        return [_trial(job) for job in jobs]
+    return list(pool.map(_trial, jobs))
 
 
 if __name__ == "__main__":
-    for M in [3, 4]:
-        N, D = 2000, 15
-        TRIALS = 50
-        print(f"\n--- Cooperative Ring Simulation (M={M}, N={N}, D={D}) ---")
-        print(f"{'Scenario (S.x)':<15} | {'Avg Wasted Pads':<15} | {'Utilization %':<10}")
-        print("-" * 55)
-
-        for x in range(1, M + 1):
-            results = [run_scenario(N, M, D, x) for _ in range(TRIALS)]
-            avg_waste = statistics.mean(results)
-            utilization = ((N - avg_waste) / N) * 100
-            print(f"S.{x:<13} | {avg_waste:<15.2f} | {utilization:<10.2f}%")
\ No newline at end of file
+    # Trials are embarrassingly parallel; stay serial (pool is None) on a single core
+    parallel = (os.cpu_count() or 1) > 1
+    with ProcessPoolExecutor() if parallel else nullcontext() as pool:
+        for M in [3, 4]:
+            N, D = 2000, 15
+            TRIALS = 50
+            print(f"\n--- Cooperative Ring Simulation (M={M}, N={N}, D={D}) ---")
+            print(f"{'Scenario (S.x)':<15} | {'Avg Wasted Pads':<15} | {'Utilization %':<10}")
+            print("-" * 55)
+
+            for x in range(1, M + 1):
+                results = run_trials(N, M, D, x, TRIALS, pool)
+                avg_waste = statistics.mean(results)
+                utilization = ((N - avg_waste) / N) * 100
+                print(f"S.{x:<13} | {avg_waste:<15.2f} | {utilization:<10.2f}%")
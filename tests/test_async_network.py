@@ -2,7 +2,7 @@ import os
 import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from src.ring_sim import AsynchronousNetwork, RingParty, run_scenario
+from src.ring_sim import AsynchronousNetwork, RingParty, RingState, get_move_status, run_scenario
 
 
 def test_modular_arithmetic_gap():
@@ -57,6 +57,48 @@ def test_perfect_secrecy_logic():
     assert not is_data, "Index 11 is burned; it should not be available for DATA."
 
 
+def test_move_status_classification():
+    """Verify data, drift and blocked moves from the shared ring state."""
+    n, m, d = 100, 2, 15
+    state = RingState.create(n, m)
+    burned = bytearray(n)
+
+    # P1 at 0 sees P2 at 50: the gap is safe and pad 1 is fresh
+    assert get_move_status(state, burned, 1, n, d) == ('data', 1)
+
+    # Same gap, but pad 1 was already used -> drift over it
+    burned[1] = 1
+    assert get_move_status(state, burned, 1, n, d) == ('drift', 1)
+
+    # P2 looks like it is within d pads ahead -> blocked
+    state.view_front[1] = 10
+    assert get_move_status(state, burned, 1, n, d) == (None, None)
+
+
+def test_move_status_wraps_around_ring():
+    """Verify get_move_status wraps both the gap and the next pad at n."""
+    n, m, d = 100, 2, 15
+    state = RingState.create(n, m)
+    burned = bytearray(n)
+
+    # Front neighbour at a lower index: the gap wraps to 20 + 100 - 90 = 30
+    state.my_index[1] = 90
+    state.view_front[1] = 20
+    assert get_move_status(state, burned, 1, n, d) == ('data', 91)
+
+    # Wrapped gap of 5 + 100 - 95 = 10 is inside the safety buffer
+    state.my_index[1] = 95
+    state.view_front[1] = 5
+    assert get_move_status(state, burned, 1, n, d) == (None, None)
+
+    # Last pad of the ring: the next pad is index 0
+    state.my_index[1] = n - 1
+    state.view_front[1] = 30
+    assert get_move_status(state, burned, 1, n, d) == ('data', 0)
+    burned[0] = 1
+    assert get_move_status(state, burned, 1, n, d) == ('drift', 0)
+
+
 def test_protocol_execution_safety():
     """
     Integration Test: Runs a full scenario and asserts that
@@ -1,9 +1,12 @@
 import os
 import random
 import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from src.ring_sim import run_scenario
+from src.ring_sim import AsynchronousNetwork, _trial, make_scenario_runner, run_scenario, run_trials
 
 
 def test_run_scenario_reproducible_with_seed():
@@ -16,3 +19,76 @@ def test_run_scenario_reproducible_with_seed():
     w2 = run_scenario(n=n, m=m, d=d, x=x)
 
     assert w1 == w2
+
+
+def test_run_scenario_with_private_rng():
+    n, m, d, x = 600, 4, 15, 3
+
+    random.seed(777)
+    global_rng = run_scenario(n=n, m=m, d=d, x=x)
+    private_rng = run_scenario(n=n, m=m, d=d, x=x, rng=random.Random(777))
+
+    assert private_rng == global_rng
+
+
+def test_scenario_runner_is_reusable():
+    n, m, d = 500, 4, 15
+    run = make_scenario_runner(n, m, d)
+
+    for x in (1, 4, 2):
+        # Reusing the runner must not leak state from earlier trials
+        assert run(x, random.Random(x)) == run_scenario(n, m, d, x, random.Random(x))
+
+
+def test_run_trials_parallel_matches_serial():
+    n, m, d, x, trials = 300, 4, 15, 2, 6
+
+    serial = run_trials(n, m, d, x, trials)
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        parallel = run_trials(n, m, d, x, trials, pool)
+
+    assert parallel == serial
+    assert len(serial) == trials
+
+
+def test_trials_reuse_one_runner_per_configuration(monkeypatch):
+    built = []
+
+    def counting_runner(n, m, d):
+        built.append((n, m, d))
+        return make_scenario_runner(n, m, d)
+
+    monkeypatch.setattr("src.ring_sim.make_scenario_runner", counting_runner)
+    jobs = [(310, 3, 15, 2, seed) for seed in range(4)]
+    results = [_trial(job) for job in jobs]
+
+    assert built == [(310, 3, 15)]
+    assert results == [run_scenario(310, 3, 15, 2, random.Random(seed)) for seed in range(4)]
+
+
+@pytest.mark.parametrize(
+    "n, m, d, x, seed, waste, moves, checksum",
+    [
+        (120, 3, 5, 2, 1, 15, 192, 5433938),
+        (200, 4, 10, 4, 7, 40, 156, 7355295),
+        (150, 4, 3, 1, 3, 12, 412, 38779927),
+    ],
+)
+def test_seeded_run_is_pinned(monkeypatch, n, m, d, x, seed, waste, moves, checksum):
+    """
+    Pins the exact broadcast sequence of a few seeded runs. The waste alone
+    is m*d for nearly every run, so any change to move selection or RNG use
+    must show up here instead.
+    """
+    sent = []
+    send_broadcast = AsynchronousNetwork.send_broadcast
+
+    def recording_send_broadcast(self, sender_id, new_index):
+        sent.append((sender_id, new_index))
+        send_broadcast(self, sender_id, new_index)
+
+    monkeypatch.setattr(AsynchronousNetwork, "send_broadcast", recording_send_broadcast)
+
+    assert run_scenario(n, m, d, x, random.Random(seed)) == waste
+    assert len(sent) == moves
+    assert sum(k * (sid * n + idx) for k, (sid, idx) in enumerate(sent, 1)) == checksum
@@ -1,6 +1,8 @@
 import os
 import sys
 
+import pytest
+
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.ring_sim import run_scenario
 
@@ -22,3 +24,9 @@ def test_waste_within_bounds():
         assert m * d <= waste <= n, (
             f"waste out of bounds: waste={waste}, expected [{m * d}, {n}] for (n,m,d,x)={(n, m, d, x)}"
         )
+
+
+@pytest.mark.parametrize("x", [-1, 5])
+def test_active_count_out_of_range_raises(x):
+    with pytest.raises(ValueError):
+        run_scenario(n=100, m=4, d=5, x=x)
@@ -3,7 +3,7 @@ import random
 import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from src.ring_sim import AsynchronousNetwork, RingParty
+from src.ring_sim import AsynchronousNetwork, RingParty, RingState
 
 
 def test_network_delivery_time_and_no_self_update(monkeypatch):
@@ -38,3 +38,73 @@ def test_network_delivery_time_and_no_self_update(monkeypatch):
 
     # Sender should NOT “receive” its own update
     assert parties[1].view_of_others[1] == 0
+
+
+def test_network_delivers_only_due_messages(monkeypatch):
+    delays = iter([5, 1])
+    monkeypatch.setattr(random, "randint", lambda a, b: next(delays))
+
+    net = AsynchronousNetwork(d_delay=5)
+    parties = {
+        1: RingParty(1, n=100, m=3, d=5),
+        2: RingParty(2, n=100, m=3, d=5),
+        3: RingParty(3, n=100, m=3, d=5),
+    }
+
+    net.send_broadcast(sender_id=1, new_index=10)  # due at t=5
+    net.send_broadcast(sender_id=2, new_index=60)  # due at t=1
+
+    # Only the short-delay message is due on the first tick
+    assert net.tick(parties) is True
+    assert parties[3].view_of_others[2] == 60
+    assert parties[3].view_of_others[1] == 0
+    assert net.pending == 1
+
+    for _ in range(3):
+        assert net.tick(parties) is False
+    assert net.tick(parties) is True
+    assert parties[3].view_of_others[1] == 10
+    assert net.pending == 0
+
+
+def test_network_delivers_into_ring_state(monkeypatch):
+    monkeypatch.setattr(random, "randint", lambda a, b: b)
+
+    net = AsynchronousNetwork(d_delay=2)
+    state = RingState.create(n=90, m=3)
+    assert state.my_index[1:] == [0, 30, 60]
+    assert state.view_front[1:] == [30, 60, 0]
+
+    net.send_broadcast(sender_id=2, new_index=45)
+    net.tick(state)
+    assert state.view_front[1] == 30
+
+    # Only P1, the party behind P2, tracks P2's position
+    net.tick(state)
+    assert state.view_front[1:] == [45, 60, 0]
+
+
+def test_single_party_ring_state_ignores_own_broadcast():
+    net = AsynchronousNetwork(d_delay=0)
+    state = RingState.create(n=50, m=1)
+    # With one party its front neighbour is itself
+    assert state.front[1] == state.behind[1] == 1
+
+    net.send_broadcast(sender_id=1, new_index=9)
+    assert net.tick(state) is True
+
+    # Sender should NOT "receive" its own update
+    assert state.view_front[1] == 0
+
+
+def test_zero_delay_delivers_on_next_tick():
+    net = AsynchronousNetwork(d_delay=0)
+    parties = {1: RingParty(1, n=100, m=2, d=0), 2: RingParty(2, n=100, m=2, d=0)}
+
+    net.send_broadcast(sender_id=1, new_index=7)
+
+    # Not visible before the clock advances
+    assert parties[2].view_of_others[1] == 0
+    assert net.tick(parties) is True
+    assert parties[2].view_of_others[1] == 7
+    assert net.pending == 0